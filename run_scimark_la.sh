@@ -36,6 +36,7 @@ POST_UNWIND=false
 KEEP_FAILED_UNWIND=false
 ENABLE_COMPILER_DEBUG=false
 MAX_ADDR2LINE=300
+SYMBOL_CACHE_DIR="${XDG_CACHE_HOME:-$HOME/.cache}/scimark_symbols"
 VERBOSE=false
 ENABLE_LOG=false
 LOG_LEVEL=""
@@ -69,6 +70,9 @@ Options:
   --post-unwind              Unwind call stacks after recording (may improve success rate)
   --keep-failed-unwind       Keep failed unwinding debug info for diagnosis
   --max-addr2line <N>        Max unresolved libartd offsets resolved by addr2line (default: 300)
+  --symbol-cache-dir <dir>   Directory for resolved libartd names, keyed by Build ID
+                             (default: \${XDG_CACHE_HOME:-~/.cache}/scimark_symbols)
+  --no-symbol-cache          Do not read or write the resolved-name cache
 
   --compiler-debug           Enable ART compiler debug dumps (cfg/disassemble/verbose-methods)
   
@@ -162,6 +166,14 @@ while [[ $# -gt 0 ]]; do
             MAX_ADDR2LINE="$2"
             shift 2
             ;;
+        --symbol-cache-dir)
+            SYMBOL_CACHE_DIR="$2"
+            shift 2
+            ;;
+        --no-symbol-cache)
+            SYMBOL_CACHE_DIR=""
+            shift
+            ;;
         --compiler-debug)
             ENABLE_COMPILER_DEBUG=true
             shift
@@ -430,40 +442,49 @@ for i in $(seq 1 $ITERATIONS); do
                  # Force overwrite with local symbols (User Request)
                  if [ -n "$SYMBOLS_DIR" ] || [ -n "$OBJ_LIB_DIR" ]; then
                      log "Forcing local symbols for ART libraries..."
-                     for lib_name in "libart.so" "libartd.so" "dalvikvm64" "libc.so"; do
+                     FORCED_LIBS=("libart.so" "libartd.so" "dalvikvm64" "libc.so")
+                     FIND_NAME_ARGS=()
+                     for lib_name in "${FORCED_LIBS[@]}"; do
+                         FIND_NAME_ARGS+=("-o" "-name" "$lib_name")
+                     done
+                     FIND_NAME_ARGS=("${FIND_NAME_ARGS[@]:1}")
+
+                     # Index candidate files with one walk per tree instead of one per library.
+                     # find visits its roots in order, so SYMBOLS_DIR matches stay ahead of OBJ_LIB_DIR.
+                     LOCAL_ROOTS=()
+                     for dir in "$SYMBOLS_DIR" "$OBJ_LIB_DIR"; do
+                         if [ -n "$dir" ] && [ -d "$dir" ]; then
+                             LOCAL_ROOTS+=("$dir")
+                         fi
+                     done
+                     LOCAL_INDEX=()
+                     if [ ${#LOCAL_ROOTS[@]} -gt 0 ]; then
+                         mapfile -t LOCAL_INDEX < <(find "${LOCAL_ROOTS[@]}" \( "${FIND_NAME_ARGS[@]}" \) 2>/dev/null)
+                     fi
+                     CACHE_INDEX=()
+                     mapfile -t CACHE_INDEX < <(find "$OUTPUT_DIR/binary_cache" \( "${FIND_NAME_ARGS[@]}" \) 2>/dev/null)
+
+                     for lib_name in "${FORCED_LIBS[@]}"; do
                          # Find local file (Prefer unstripped)
                          LOCAL_FILE=""
-                         
-                         # Helper function to find unstripped file in a directory
-                         find_unstripped() {
-                             local dir="$1"
-                             local name="$2"
-                             if [ -d "$dir" ]; then
-                                 find "$dir" -name "$name" | while read -r cand; do
-                                     if file "$cand" | grep -q "not stripped"; then
-                                         echo "$cand"
-                                         break
-                                     fi
-                                 done
+                         for cand in "${LOCAL_INDEX[@]}"; do
+                             if [ "${cand##*/}" = "$lib_name" ] && file "$cand" | grep -q "not stripped"; then
+                                 LOCAL_FILE="$cand"
+                                 break
                              fi
-                         }
-                         
-                         # Try SYMBOLS_DIR first
-                         if [ -n "$SYMBOLS_DIR" ]; then
-                             LOCAL_FILE=$(find_unstripped "$SYMBOLS_DIR" "$lib_name" | head -n 1)
-                         fi
-                         
-                         # Try OBJ_LIB_DIR if not found
-                         if [ -z "$LOCAL_FILE" ] && [ -n "$OBJ_LIB_DIR" ]; then
-                             LOCAL_FILE=$(find_unstripped "$OBJ_LIB_DIR" "$lib_name" | head -n 1)
-                         fi
+                         done
                          
                          if [ -f "$LOCAL_FILE" ]; then
                              log "Found local unstripped $lib_name: $LOCAL_FILE"
                              # Find in binary_cache
-                             CACHE_FILES=$(find "$OUTPUT_DIR/binary_cache" -name "$lib_name")
-                             if [ -n "$CACHE_FILES" ]; then
-                                 for cache_file in $CACHE_FILES; do
+                             CACHE_FILES=()
+                             for cand in "${CACHE_INDEX[@]}"; do
+                                 if [ "${cand##*/}" = "$lib_name" ]; then
+                                     CACHE_FILES+=("$cand")
+                                 fi
+                             done
+                             if [ ${#CACHE_FILES[@]} -gt 0 ]; then
+                                 for cache_file in "${CACHE_FILES[@]}"; do
                                      log "Overwriting cache file: $cache_file"
                                      cp -f "$LOCAL_FILE" "$cache_file"
                                  done
@@ -617,17 +638,30 @@ for i in $(seq 1 $ITERATIONS); do
                  
                  # 4. Post-process to resolve remaining unresolved symbols using addr2line
                  log "Post-processing unresolved symbols..."
-                 python3 - <<'PYEOF' "$OUTPUT_DIR/out.folded.raw" "$OUTPUT_DIR/out.folded" "$OUTPUT_DIR/binary_cache" "$MAX_ADDR2LINE"
+                 # The post-processor reports unresolved/dexfile token counts itself, so the
+                 # folded files are not re-scanned with grep afterwards.
+                 POSTPROCESS_STATS=$(python3 - <<'PYEOF' "$OUTPUT_DIR/out.folded.raw" "$OUTPUT_DIR/out.folded" "$OUTPUT_DIR/binary_cache" "$MAX_ADDR2LINE" "$SYMBOL_CACHE_DIR"
+import json
+import mmap
+import os
 import sys
 import re
+import shutil
 import subprocess
-from collections import Counter, defaultdict
+import tempfile
+import threading
+from array import array
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 input_file = sys.argv[1]
 output_file = sys.argv[2]
 binary_cache = sys.argv[3]
 max_addr2line = int(sys.argv[4])
+# Empty when the resolved-name cache is disabled (--no-symbol-cache)
+symbol_cache_dir = sys.argv[5]
 
 # Find libartd.so in binary_cache
 libartd_path = None
@@ -637,97 +671,378 @@ for p in Path(binary_cache).rglob("libartd.so"):
 
 if not libartd_path:
     # No libartd.so found, just copy the file
-    with open(input_file, 'r') as f_in, open(output_file, 'w') as f_out:
-        f_out.write(f_in.read())
+    shutil.copyfile(input_file, output_file)
+    sys.exit(0)
+
+if os.path.getsize(input_file) == 0:
+    # Nothing to fold (and an empty file cannot be mmapped)
+    open(output_file, 'wb').close()
     sys.exit(0)
 
-line_re = re.compile(r'^(.*)\s+(\d+)$')
-libartd_re = re.compile(r'libartd\.so\[\+([0-9a-f]+)\]')
-dexfile_re = re.compile(r'^dexfile_in_memory_pid_[^;]*\[\+[0-9a-f]+\]$')
+# Folded stacks are processed as bytes end to end; only resolved names are encoded.
+# Stacks are screened with a plain substring search before any regex runs, and
+# frame checks use fullmatch so the pattern needs no anchors.
+libartd_token = b'libartd.so[+'
+libartd_re = re.compile(rb'libartd\.so\[\+([0-9a-f]+)\]')
+dexfile_prefix = b'dexfile_in_memory_pid_'
+dexfile_re = re.compile(rb'dexfile_in_memory_pid_[^;]*\[\+[0-9a-f]+\]')
 
 # Cache for addr2line results
 addr_cache = {}
+# Many offsets resolve to the same function; share one string object per name.
+name_intern = {}
 
-def resolve_address(addr_hex):
+# Resolved names persist across runs in a per-Build-ID JSON file, so a rebuilt
+# libartd.so never picks up stale entries. A stripped copy shares its Build ID with
+# the unstripped original but addr2line falls back to the nearest exported symbol
+# on it, so the cache is only used when the binary carries .symtab or .debug_info.
+# Failures are not persisted either.
+
+def read_build_id(path):
     try:
-        result = subprocess.run(
-            ['addr2line', '-e', libartd_path, '-f', '-C', addr_hex],
-            capture_output=True, text=True, timeout=1
-        )
-        lines = result.stdout.strip().splitlines()
-        if len(lines) >= 1 and lines[0] != '??':
-            func_name = lines[0]
-            func_name = re.sub(r'\s*\[clone.*?\]$', '', func_name)
-            return func_name
-    except:
+        result = subprocess.run(['readelf', '-n', path], capture_output=True, text=True,
+                                errors='replace', timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    m = re.search(r'Build ID:\s*([0-9a-f]+)', result.stdout)
+    return m.group(1) if m else None
+
+def has_full_symbols(path):
+    try:
+        result = subprocess.run(['readelf', '-S', '-W', path], capture_output=True, text=True,
+                                errors='replace', timeout=10)
+    except (OSError, subprocess.SubprocessError):
+        return False
+    return re.search(r'\s\.(symtab|debug_info)\s', result.stdout) is not None
+
+def load_symbol_cache(build_id):
+    try:
+        with open(os.path.join(symbol_cache_dir, build_id + '.json'), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_symbol_cache(build_id, entries):
+    try:
+        os.makedirs(symbol_cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=symbol_cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, os.path.join(symbol_cache_dir, build_id + '.json'))
+    except OSError:
         pass
+
+def clean_func_name(func_name):
+    func_name = re.sub(r'\s*\[clone.*?\]$', '', func_name)
+    return name_intern.setdefault(func_name, func_name)
+
+function_symbol_types = {'t', 'T', 'w', 'W'}
+
+def load_symtab(path):
+    # Sized function symbols from `nm`, sorted by start address for bisect lookups.
+    # Fall back to the dynamic table when the binary has no .symtab.
+    symbols = []
+    for nm_args in (['nm', '-C', '-S', '--defined-only'], ['nm', '-C', '-S', '-D', '--defined-only']):
+        try:
+            result = subprocess.run(nm_args + [path], capture_output=True, text=True,
+                                    errors='replace', timeout=60)
+        except (OSError, subprocess.SubprocessError):
+            break
+        for line in result.stdout.splitlines():
+            parts = line.split(' ', 3)
+            if len(parts) == 4 and parts[2] in function_symbol_types:
+                start = int(parts[0], 16)
+                symbols.append((start, start + int(parts[1], 16), parts[3]))
+        if symbols:
+            break
+    symbols.sort()
+    return (array('Q', [sym[0] for sym in symbols]),
+            array('Q', [sym[1] for sym in symbols]),
+            [sym[2] for sym in symbols])
+
+def symtab_lookup(vaddr):
+    idx = bisect_right(symtab_starts, vaddr) - 1
+    if idx >= 0 and vaddr < symtab_ends[idx]:
+        return clean_func_name(symtab_names[idx])
     return None
 
-# First pass: parse lines, strip noisy dexfile wrapper frames, and count unresolved offsets.
-entries = []
-addr_counter = Counter()
-with open(input_file, 'r') as f_in:
-    for line in f_in:
+def feed_addresses(stdin, addrs):
+    try:
+        for addr in addrs:
+            stdin.write(addr + '\n')
+    except OSError:
+        pass
+    finally:
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+def resolve_addresses(addrs):
+    # One addr2line process for the whole batch: DWARF is loaded once and
+    # addr2line prints a function/location line pair per stdin address.
+    # A writer thread feeds addresses while results are consumed as they are
+    # printed, so neither side buffers the whole batch.
+    resolved = {}
+    try:
+        process = subprocess.Popen(
+            ['addr2line', '-e', libartd_path, '-f', '-C'],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, encoding='utf-8', errors='replace', bufsize=1
+        )
+    except OSError:
+        return resolved
+    writer = threading.Thread(target=feed_addresses, args=(process.stdin, addrs), daemon=True)
+    writer.start()
+    # Stop waiting on a wedged addr2line; whatever was already printed is kept.
+    watchdog = threading.Timer(max(10, len(addrs)), process.kill)
+    watchdog.start()
+    try:
+        stdout = process.stdout
+        for addr in addrs:
+            func_name = stdout.readline()
+            if not func_name or not stdout.readline():
+                break
+            func_name = func_name.rstrip('\n')
+            if func_name and func_name != '??':
+                resolved[addr] = clean_func_name(func_name)
+            else:
+                resolved[addr] = None
+    finally:
+        watchdog.cancel()
+        process.kill()
+        process.wait()
+        writer.join()
+    return resolved
+
+# Each addr2line process loads DWARF on its own, so only split batches that are big
+# enough to amortize that, and keep very large binaries to a single process to
+# bound peak memory. The work happens in the child processes, so threads suffice.
+min_addrs_per_worker = 64
+max_parallel_binary_size = 512 * 1024 * 1024
+
+def resolve_addresses_parallel(addrs):
+    workers = min(8, os.cpu_count() or 1, len(addrs) // min_addrs_per_worker)
+    if workers <= 1 or os.path.getsize(libartd_path) > max_parallel_binary_size:
+        return resolve_addresses(addrs)
+    resolved = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for chunk_resolved in executor.map(resolve_addresses,
+                                           [addrs[i::workers] for i in range(workers)]):
+            resolved.update(chunk_resolved)
+    return resolved
+
+# First pass: parse lines, strip noisy dexfile wrapper frames, and fold stacks.
+# Frames are interned to integer ids and stacks are keyed by id tuples, so memory
+# stays proportional to the number of unique stacks and unique frames, and the
+# offset regexes below run once per unique frame instead of once per stack.
+class IdTable(dict):
+    # Assigns the next integer id on first lookup. Mapping frames through
+    # map(table.__getitem__, ...) keeps the per-frame loop in C and only
+    # calls back into Python for frames not seen before.
+    def __missing__(self, key):
+        new_id = self[key] = len(self)
+        return new_id
+
+class FrameIdTable(IdTable):
+    # Classifies each frame once, when it gets its id: wrapper[frame_id] is 1 for
+    # dexfile wrapper frames, so per-stack filtering is a byte lookup per frame.
+    def __init__(self):
+        super().__init__()
+        self.wrapper = bytearray()
+
+    def __missing__(self, frame):
+        self.wrapper.append(frame.startswith(dexfile_prefix) and dexfile_re.fullmatch(frame) is not None)
+        return super().__missing__(frame)
+
+frame_ids = FrameIdTable()
+is_wrapper = frame_ids.wrapper
+lookup_frame_id = frame_ids.__getitem__
+# Each entry is [samples, input lines]; lines that only differed by dexfile wrappers
+# share a key, and the resolution summary still counts them separately.
+stacks = {}
+
+# Returns the raw token counts for the shell's before/after summary, taken here
+# instead of grepping both folded files again afterwards. strip_wrappers is False
+# when the input has no dexfile wrappers, which skips the per-line wrapper work.
+def fold(mm, strip_wrappers):
+    raw_unresolved = 0
+    raw_dexfile = 0
+    # stackcollapse-perf.pl emits each stack once, sorted, so sibling stacks are
+    # adjacent. Remembering only the previous line's parent stack (everything above
+    # the leaf) and its id tuple lets siblings look up just their leaf frame.
+    prev_parent = None
+    prev_parent_key = ()
+    for line in iter(mm.readline, b''):
         line = line.rstrip()
         if not line:
             continue
-        m = line_re.match(line)
-        if not m:
+        # Folded lines are "<stack> <count>"; split on the last space instead of regex matching.
+        stack, sep, count = line.rpartition(b' ')
+        if not sep or not count.isdigit():
             continue
-        stack = m.group(1)
-        count = int(m.group(2))
+        raw_unresolved += stack.count(libartd_token)
+
+        parent, sep, leaf = stack.rpartition(b';')
+        if not sep:
+            parent_key = ()
+        elif parent == prev_parent:
+            parent_key = prev_parent_key
+        else:
+            parent_key = tuple(map(lookup_frame_id, parent.split(b';')))
+            prev_parent = parent
+            prev_parent_key = parent_key
+        key = parent_key + (lookup_frame_id(leaf),)
 
         # Drop dexfile offset wrappers when there are deeper frames, to reduce flamegraph noise.
-        frames = stack.split(';')
-        if len(frames) > 2:
-            frames = [f for idx, f in enumerate(frames)
-                      if not (idx < len(frames) - 1 and dexfile_re.match(f))]
-            stack = ';'.join(frames)
+        # Stacks without any wrapper keep their ids as-is; otherwise filter the ids above
+        # the leaf frame through the wrapper table and keep the leaf.
+        if strip_wrappers:
+            raw_dexfile += stack.count(dexfile_prefix)
+            if len(key) > 2 and dexfile_prefix in stack:
+                key = tuple([i for i in key[:-1] if not is_wrapper[i]]) + key[-1:]
+
+        entry = stacks.get(key)
+        if entry is None:
+            stacks[key] = [int(count), 1]
+        else:
+            entry[0] += int(count)
+            entry[1] += 1
+    return raw_unresolved, raw_dexfile
 
-        for addr in libartd_re.findall(stack):
-            addr_counter[addr] += count
-        entries.append((stack, count))
+# Decide from what the whole input contains (two C-level scans of the mapping)
+# whether parsing is needed at all, and whether lines need the wrapper checks.
+with open(input_file, 'rb') as f_in, \
+        mmap.mmap(f_in.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    has_libartd = mm.find(libartd_token) != -1
+    has_dexfile = mm.find(dexfile_prefix) != -1
+    if not has_libartd and not has_dexfile:
+        # Nothing to resolve or strip, just copy the file
+        shutil.copyfile(input_file, output_file)
+        sys.exit(0)
+    raw_unresolved, raw_dexfile = fold(mm, has_dexfile)
+frames_by_id = list(frame_ids)
+
+# Weight each unique frame by the samples it appears in, then count unresolved offsets.
+frame_weights = [0] * len(frames_by_id)
+for key, (count, _) in stacks.items():
+    for frame_id in key:
+        frame_weights[frame_id] += count
+addr_counter = Counter()
+for frame, weight in zip(frames_by_id, frame_weights):
+    if libartd_token in frame:
+        for addr in libartd_re.findall(frame):
+            addr_counter[addr.decode('ascii')] += weight
 
 # Resolve high-impact unresolved libartd offsets first (avoid very long hangs).
-addresses = [addr for addr, _ in addr_counter.most_common(max_addr2line)]
-for addr in addresses:
-    addr_cache[addr] = resolve_address(addr)
-
-agg = defaultdict(int)
-resolved_count = 0
-for stack, count in entries:
-    def replace_unresolved(match):
-        addr = match.group(1)
-        replacement = addr_cache.get(addr)
-        if replacement:
-            return replacement
-        return match.group(0)
-
-    replaced = libartd_re.sub(replace_unresolved, stack)
-    if replaced != stack:
-        # Approximate resolved entries by comparing unresolved-token count delta.
-        resolved_count += max(0, len(libartd_re.findall(stack)) - len(libartd_re.findall(replaced)))
-    agg[replaced] += count
-
-with open(output_file, 'w') as f_out:
-    for stack in sorted(agg.keys()):
-        f_out.write(f"{stack} {agg[stack]}\n")
+# Offsets already in the persistent cache are applied regardless of the limit.
+build_id = None
+if symbol_cache_dir and has_full_symbols(libartd_path):
+    build_id = read_build_id(libartd_path)
+symbol_cache = load_symbol_cache(build_id) if build_id else {}
+for addr in addr_counter:
+    if addr in symbol_cache:
+        addr_cache[addr] = symbol_cache[addr]
+
+# addr2line keeps priority for the hottest offsets because it names inlined callees;
+# offsets past the limit, or that addr2line could not place, fall back to the ELF
+# symbol table, which only knows the enclosing function.
+addresses = [addr for addr, _ in addr_counter.most_common(max_addr2line)
+             if addr not in addr_cache]
+if addresses:
+    resolved = resolve_addresses_parallel(addresses)
+    addr_cache.update(resolved)
+    found = {addr: func_name for addr, func_name in resolved.items() if func_name}
+    if build_id and found:
+        symbol_cache.update(found)
+        save_symbol_cache(build_id, symbol_cache)
+
+symtab_resolved = 0
+remaining = [addr for addr in addr_counter if not addr_cache.get(addr)]
+if remaining:
+    symtab_starts, symtab_ends, symtab_names = load_symtab(libartd_path)
+    for addr in remaining:
+        func_name = symtab_lookup(int(addr, 16))
+        if func_name:
+            addr_cache[addr] = func_name
+            symtab_resolved += 1
+
+replacements = {addr.encode('ascii'): func_name.encode('utf-8')
+                for addr, func_name in addr_cache.items() if func_name}
+
+def replace_unresolved(match):
+    return replacements.get(match.group(1), match.group(0))
+
+resolved_frames = [libartd_re.sub(replace_unresolved, frame) if libartd_token in frame else frame
+                   for frame in frames_by_id]
+
+# Different offsets can resolve to the same name, so give resolved frames their own
+# ids and re-fold on id tuples; strings are joined once per output stack.
+resolved_ids = IdTable()
+resolved_id_of = list(map(resolved_ids.__getitem__, resolved_frames))
+resolved_by_id = list(resolved_ids)
+agg = {}
+for key, (count, lines) in stacks.items():
+    resolved_key = tuple([resolved_id_of[frame_id] for frame_id in key])
+    entry = agg.get(resolved_key)
+    if entry is None:
+        agg[resolved_key] = [count, lines]
+    else:
+        entry[0] += count
+        entry[1] += lines
+
+# flamegraph.pl sorts stacks itself, so write them in fold order. Stacks go through
+# the file's write buffer as they are joined rather than being assembled into one
+# output blob, which would hold the whole folded output in memory twice.
+# Bind the hot-loop callables locally so each stack skips the attribute lookups.
+# Substitution ran once per unique frame, so the summary derives the resolved token
+# count per input line from the tokens still left in each output stack.
+join = b';'.join
+unresolved_left = 0
+final_unresolved = 0
+final_dexfile = 0
+with open(output_file, 'wb') as f_out:
+    write = f_out.write
+    for key, (count, lines) in agg.items():
+        stack = join([resolved_by_id[i] for i in key])
+        unresolved = stack.count(libartd_token)
+        final_unresolved += unresolved
+        unresolved_left += unresolved * lines
+        final_dexfile += stack.count(dexfile_prefix)
+        write(b'%s %d\n' % (stack, count))
+resolved_count = raw_unresolved - unresolved_left
 
 print(f"[postprocess] resolved_libartd_offsets={resolved_count}", file=sys.stderr)
+print(f"[postprocess] symtab_resolved={symtab_resolved}", file=sys.stderr)
 print(f"[postprocess] addr2line_candidates={len(addresses)} (max={max_addr2line})", file=sys.stderr)
+
+# Summary for the calling shell, one key=value per line on stdout.
+print(f"raw_unresolved={raw_unresolved}")
+print(f"final_unresolved={final_unresolved}")
+print(f"raw_dexfile={raw_dexfile}")
+print(f"final_dexfile={final_dexfile}")
 PYEOF
+)
                  
                  # Check resolution improvement
-                 RAW_UNRESOLVED=$(grep -oE 'libartd\.so\[\+[0-9a-f]+\]' "$OUTPUT_DIR/out.folded.raw" 2>/dev/null | wc -l || echo 0)
-                 FINAL_UNRESOLVED=$(grep -oE 'libartd\.so\[\+[0-9a-f]+\]' "$OUTPUT_DIR/out.folded" 2>/dev/null | wc -l || echo 0)
+                 RAW_UNRESOLVED=0
+                 FINAL_UNRESOLVED=0
+                 RAW_DEXFILE=0
+                 FINAL_DEXFILE=0
+                 while IFS='=' read -r stat_key stat_value; do
+                     case "$stat_key" in
+                         raw_unresolved) RAW_UNRESOLVED=$stat_value ;;
+                         final_unresolved) FINAL_UNRESOLVED=$stat_value ;;
+                         raw_dexfile) RAW_DEXFILE=$stat_value ;;
+                         final_dexfile) FINAL_DEXFILE=$stat_value ;;
+                     esac
+                 done <<< "$POSTPROCESS_STATS"
                  RESOLVED_COUNT=$((RAW_UNRESOLVED - FINAL_UNRESOLVED))
                  
                  if [ "$RESOLVED_COUNT" -gt 0 ]; then
                      log "addr2line resolved $RESOLVED_COUNT additional symbols"
                  fi
 
-                 RAW_DEXFILE=$(grep -oE 'dexfile_in_memory_pid_[^; ]+\[\+[0-9a-f]+\]' "$OUTPUT_DIR/out.folded.raw" 2>/dev/null | wc -l || echo 0)
-                 FINAL_DEXFILE=$(grep -oE 'dexfile_in_memory_pid_[^; ]+\[\+[0-9a-f]+\]' "$OUTPUT_DIR/out.folded" 2>/dev/null | wc -l || echo 0)
                  if [ "$RAW_DEXFILE" -gt "$FINAL_DEXFILE" ]; then
                      log "Post-process removed $((RAW_DEXFILE - FINAL_DEXFILE)) noisy dexfile wrapper frames"
                  fi